@@ -24,6 +24,9 @@ class TestParseYamlatorSchema(unittest.TestCase):
         ('with_schema_nested_union',
             './tests/files/invalid_files/nested_union.ys',
             SchemaParseError),
+        ('with_missing_schema_block',
+            './tests/files/invalid_files/missing_schema_block.ys',
+            SchemaParseError),
     ])
     def test_with_invalid_schema_paths(self, name: str,
                                        schema_path: typing.Any,
@@ -47,6 +50,14 @@ class TestParseYamlatorSchema(unittest.TestCase):
         schema = parse_yamlator_schema(schema_path)
         self.assertIsNotNone(schema)
 
+    def test_with_cached_child_schema_missing_schema_block(self):
+        # Parsing the parent caches base.ys as an import; a direct
+        # parse of the child must still reject the missing schema block
+        parse_yamlator_schema('./tests/files/valid/with_imports.ys')
+
+        with self.assertRaises(SchemaParseError):
+            parse_yamlator_schema('./tests/files/valid/base.ys')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -50,13 +50,13 @@ class TestSchemaTransformer(unittest.TestCase):
     def test_required_rule(self):
         tokens = (self.name_token, self.str_rtype)
 
-        required_rule = self.transformer.required_rule(tokens)
+        required_rule = self.transformer.required_rule(*tokens)
         self.assertEqual(self.name_token.value, required_rule.name)
         self.assertTrue(required_rule.is_required)
 
     def test_optional_rule(self):
         tokens = (self.name_token, self.str_rtype)
-        optional_rule = self.transformer.optional_rule(tokens)
+        optional_rule = self.transformer.optional_rule(*tokens)
 
         self.assertEqual(self.name_token.value, optional_rule.name)
         self.assertFalse(optional_rule.is_required)
@@ -124,15 +124,15 @@ class TestSchemaTransformer(unittest.TestCase):
         self.assertEqual(expected_ruleset_count, len(rulesets))
 
     def test_str_type(self):
-        str_rule_type = self.transformer.str_type(())
+        str_rule_type = self.transformer.str_type()
         self.assertEqual(SchemaTypes.STR, str_rule_type.schema_type)
 
     def test_int_type(self):
-        int_rule_type = self.transformer.int_type(())
+        int_rule_type = self.transformer.int_type()
         self.assertEqual(SchemaTypes.INT, int_rule_type.schema_type)
 
     def test_float_type(self):
-        float_rule_type = self.transformer.float_type(())
+        float_rule_type = self.transformer.float_type()
         self.assertEqual(SchemaTypes.FLOAT, float_rule_type.schema_type)
 
     def test_list_type(self):
@@ -150,11 +150,11 @@ class TestSchemaTransformer(unittest.TestCase):
         self.assertEqual(tokens[0], map_type.sub_type)
 
     def test_any_type(self):
-        any_type = self.transformer.any_type(())
+        any_type = self.transformer.any_type()
         self.assertEqual(SchemaTypes.ANY, any_type.schema_type)
 
     def test_bool_type(self):
-        bool_type = self.transformer.bool_type(())
+        bool_type = self.transformer.bool_type()
         self.assertEqual(SchemaTypes.BOOL, bool_type.schema_type)
 
     def test_enum_item(self):
@@ -232,7 +232,7 @@ class TestSchemaTransformer(unittest.TestCase):
             self.transformer.union_type(tokens)
 
     def test_type(self):
-        type_token = self.transformer.type((self.name_token, ))
+        type_token = self.transformer.type(self.name_token)
         self.assertEqual(self.name_token, type_token)
 
     def test_schema_entry(self):
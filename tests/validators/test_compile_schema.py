@@ -0,0 +1,58 @@
+"""Test cases for the compile_schema function
+
+Test cases:
+    * `test_compile_schema_with_none_schema` tests compiling a schema
+       when the schema is `None`
+    * `test_compiled_validator_with_none_data` tests the compiled
+       validator when the YAML data is `None`
+    * `test_compiled_validator_is_reusable` tests that a compiled
+       validator can validate multiple documents without violations
+       leaking between calls
+"""
+
+
+import unittest
+
+from yamlator.types import Rule
+from yamlator.types import RuleType
+from yamlator.types import YamlatorRuleset
+from yamlator.types import YamlatorSchema
+from yamlator.types import SchemaTypes
+from yamlator.validators.compile import compile_schema
+
+
+def create_flat_schema() -> YamlatorSchema:
+    rules = [
+        Rule('message', RuleType(schema_type=SchemaTypes.STR), True),
+        Rule('number', RuleType(schema_type=SchemaTypes.INT), False),
+    ]
+
+    return YamlatorSchema(
+        root=YamlatorRuleset('main', rules),
+        rulesets={},
+        enums={},
+    )
+
+
+class TestCompileSchema(unittest.TestCase):
+    def test_compile_schema_with_none_schema(self):
+        with self.assertRaises(ValueError):
+            compile_schema(None)
+
+    def test_compiled_validator_with_none_data(self):
+        validate = compile_schema(create_flat_schema())
+        with self.assertRaises(ValueError):
+            validate(None)
+
+    def test_compiled_validator_is_reusable(self):
+        validate = compile_schema(create_flat_schema())
+
+        invalid_violations = validate({'message': 42})
+        self.assertEqual(1, len(invalid_violations))
+
+        valid_violations = validate({'message': 'hello', 'number': 1})
+        self.assertEqual(0, len(valid_violations))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -33,13 +33,17 @@ class TestMapValidator(BaseValidatorTest):
         ('with_map_rule_type', {'message1': 'wow', 'message2': 'wow'},
             RuleType(schema_type=SchemaTypes.MAP,
                      sub_type=RuleType(schema_type=SchemaTypes.STR)),
-            2, 0),
+            0, 0),
+        ('with_map_rule_invalid_primitive_data', {'message1': 42},
+            RuleType(schema_type=SchemaTypes.MAP,
+                     sub_type=RuleType(schema_type=SchemaTypes.STR)),
+            0, 1),
         ('with_nested_map_rule_type', {'hello': {'message1': 'test'}},
             RuleType(schema_type=SchemaTypes.MAP,
                      sub_type=RuleType(
                             schema_type=SchemaTypes.MAP,
                             sub_type=RuleType(schema_type=SchemaTypes.STR))),
-            1, 0),
+            0, 0),
         ('with_map_rule_none_data', None,
             RuleType(schema_type=SchemaTypes.MAP,
                      sub_type=RuleType(schema_type=SchemaTypes.STR)),
@@ -5,21 +5,13 @@ import argparse
 
 from typing import Iterator
 
-from yamlator.utils import load_yaml_file
-from yamlator.parser import SchemaSyntaxError
-from yamlator.parser import parse_yamlator_schema
-from yamlator.validators.core import validate_yaml
-
 from yamlator.exceptions import SchemaParseError
 from yamlator.exceptions import ConstructNotFoundError
 from yamlator.exceptions import InvalidSchemaFilenameError
 from yamlator.exceptions import CycleDependencyError
 from yamlator.violations import Violation
 
-from yamlator.cmd.outputs import SuccessCode
-from yamlator.cmd.outputs import JSONOutput
-from yamlator.cmd.outputs import TableOutput
-from yamlator.cmd.outputs import YAMLOutput
+from yamlator.cmd.outputs.base import SuccessCode
 
 
 def main() -> int:
@@ -32,6 +24,10 @@ def main() -> int:
     args = parser.parse_args()
     violations = []
 
+    # Imported here so the help and argument error paths do not
+    # pay the cost of loading Lark and the validator chain
+    from yamlator.parser import SchemaSyntaxError
+
     try:
         violations = validate_yaml_data_from_file(
             yaml_filepath=args.file,
@@ -40,19 +36,11 @@ def main() -> int:
     except SchemaParseError as ex:
         print(f'Error when parsing schema: {ex}')
         return SuccessCode.ERR
-    except SchemaSyntaxError as ex:
-        print(ex)
-        return SuccessCode.ERR
-    except InvalidSchemaFilenameError as ex:
-        print(ex)
-        return SuccessCode.ERR
-    except FileNotFoundError as ex:
-        print(ex)
-        return SuccessCode.ERR
     except CycleDependencyError as ex:
         print(f'Cycle Detected Error: {ex}')
         return SuccessCode.ERR
-    except ValueError as ex:
+    except (SchemaSyntaxError, InvalidSchemaFilenameError,
+            FileNotFoundError, ValueError) as ex:
         print(ex)
         return SuccessCode.ERR
 
@@ -101,6 +89,12 @@ def validate_yaml_data_from_file(yaml_filepath: str,
         SchemaParseError: If there was an error parsing the schema, e.g
             syntax error or a type that was not found
     """
+    # Imported here to keep loading the yamlator.cmd package lightweight
+    # for code paths that never run a validation
+    from yamlator.utils import load_yaml_file
+    from yamlator.parser import parse_yamlator_schema
+    from yamlator.validators.core import validate_yaml
+
     yaml_data = load_yaml_file(yaml_filepath)
     instructions = None
     try:
@@ -142,6 +136,12 @@ def display_violations(violations: Iterator[Violation],
     if method is None:
         raise ValueError('method should not be None')
 
+    # Imported here so the help and argument error paths do not pay
+    # the cost of loading PyYAML through the YAML output strategy
+    from yamlator.cmd.outputs import JSONOutput
+    from yamlator.cmd.outputs import TableOutput
+    from yamlator.cmd.outputs import YAMLOutput
+
     strategies = {
         DisplayMethod.JSON: JSONOutput,
         DisplayMethod.TABLE: TableOutput,
@@ -1,9 +1,24 @@
 """Shortcuts for accessing display options"""
 
+import importlib
+
 from yamlator.cmd.outputs.base import SuccessCode
-from yamlator.cmd.outputs.json_output import JSONOutput
-from yamlator.cmd.outputs.table_output import TableOutput
-from yamlator.cmd.outputs.yaml_output import YAMLOutput
+
+# The display classes are resolved lazily (PEP 562) so importing this
+# package for SuccessCode does not pay the cost of loading PyYAML and
+# the other display dependencies until violations need displaying
+_LAZY_DISPLAY_CLASSES = {
+    'JSONOutput': 'yamlator.cmd.outputs.json_output',
+    'TableOutput': 'yamlator.cmd.outputs.table_output',
+    'YAMLOutput': 'yamlator.cmd.outputs.yaml_output',
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_DISPLAY_CLASSES.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return getattr(importlib.import_module(module_name), name)
 
 
 __all__ = [
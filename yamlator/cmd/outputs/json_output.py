@@ -1,14 +1,36 @@
 """Display output class for generating JSON"""
 
 import json
+
+from collections import deque
+from typing import Any
 from typing import Iterator
 
 from yamlator.violations import Violation
-from yamlator.violations import ViolationJSONEncoder
 from yamlator.cmd.outputs.base import SuccessCode
 from yamlator.cmd.outputs.base import ViolationOutput
 
 
+def _encode_violation(o: Any) -> Any:
+    """Encodes a deque or violation object into a JSON serializable
+    object. If the object cannot be serialized, then the `TypeError`
+    exception is raised
+    """
+    if isinstance(o, deque):
+        return list(o)
+
+    if isinstance(o, Violation):
+        return {
+            'key': o.key,
+            'parent': o.parent,
+            'message': o.message,
+            'violation_type': o.violation_type
+        }
+
+    raise TypeError(
+        f'Object of type {type(o).__name__} is not JSON serializable')
+
+
 class JSONOutput(ViolationOutput):
     """Displays violations as JSON"""
 
@@ -30,6 +52,9 @@ class JSONOutput(ViolationOutput):
         if violations is None:
             raise ValueError('violations should not be None')
 
+        # Materialize the violations so a lazy iterator is not
+        # consumed by counting it before it is serialized
+        violations = tuple(violations)
         violation_count = len(violations)
         pre_json_data = {
             'violations': violations,
@@ -37,7 +62,7 @@ class JSONOutput(ViolationOutput):
         }
 
         json_data = json.dumps(pre_json_data,
-                               cls=ViolationJSONEncoder, indent=4)
+                               default=_encode_violation, indent=4)
         print(json_data)
 
         return SuccessCode.SUCCESS if violation_count == 0 else SuccessCode.ERR
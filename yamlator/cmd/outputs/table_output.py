@@ -1,5 +1,7 @@
 """Display output class for generating a table"""
 
+import sys
+
 from typing import Iterator
 
 from yamlator.violations import Violation
@@ -28,21 +30,30 @@ class TableOutput(ViolationOutput):
         if violations is None:
             raise ValueError('violations should not be None')
 
+        # Materialize the violations so a lazy iterator is not consumed
+        # by counting it before the rows are rendered
+        violations = tuple(violations)
         violation_count = len(violations)
-        print(f'\n{violation_count:<4} violation(s) found')
+
+        # The table is built up as a list of lines and written in a
+        # single call to avoid the per-line overhead of print
+        lines = [f'\n{violation_count:<4} violation(s) found']
 
         has_violations = violation_count != 0
         if not has_violations:
+            sys.stdout.write('\n'.join(lines) + '\n')
             return SuccessCode.SUCCESS
 
         parent_title = 'Parent Key'
         key_title = 'Key'
         violation_title = 'Violation'
         message_title = 'Message'
-        print(f'\n{parent_title:<30} {key_title:<20} {violation_title:<15} {message_title:<20}')  # nopep8 pylint: disable=C0301
+        lines.append(f'\n{parent_title:<30} {key_title:<20} {violation_title:<15} {message_title:<20}')  # nopep8 pylint: disable=C0301
 
-        print('---------------------------------------------------------------------------')  # nopep8 pylint: disable=C0301
+        lines.append('---------------------------------------------------------------------------')  # nopep8 pylint: disable=C0301
         for violation in violations:
-            print(f'{violation.parent:<30} {violation.key:<20} {violation.violation_type:<15} {violation.message:<20}')  # nopep8 pylint: disable=C0301
-        print('---------------------------------------------------------------------------')  # nopep8 pylint: disable=C0301
+            lines.append(f'{violation.parent:<30} {violation.key:<20} {violation.violation_type:<15} {violation.message:<20}')  # nopep8 pylint: disable=C0301
+        lines.append('---------------------------------------------------------------------------')  # nopep8 pylint: disable=C0301
+
+        sys.stdout.write('\n'.join(lines) + '\n')
         return SuccessCode.ERR
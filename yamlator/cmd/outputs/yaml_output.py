@@ -42,6 +42,11 @@ class YAMLOutput(ViolationOutput):
 
         YAMLOutput._set_up_dumper()
 
+        # Materialize the violations so a lazy iterator is not
+        # consumed by counting it before it is serialized. A list is
+        # used since yaml.dump emits it as a plain sequence, which a
+        # tuple would render as a !!python/tuple tag
+        violations = list(violations)
         violation_count = len(violations)
         data = {
             'violations': violations,
@@ -1,8 +1,9 @@
 """Maintains the parser transformers"""
 
-import re
 import os
+import sys
 import enum
+import functools
 
 from pathlib import Path
 from typing import Iterator
@@ -10,8 +11,8 @@ from typing import Any
 
 from lark import Lark
 from lark import v_args
-from lark import Transformer
 from lark import Token
+from lark.visitors import Transformer_InPlace
 from lark import UnexpectedInput
 from lark.exceptions import VisitError
 
@@ -31,10 +32,43 @@ from yamlator.exceptions import NestedUnionError
 from yamlator.exceptions import SchemaParseError
 
 
-_package_dir = Path(__file__).parent.parent.absolute()
-_GRAMMAR_FILE = os.path.join(_package_dir, 'grammar/grammar.lark')
-
-_QUOTES_REGEX = re.compile(r'\"|\'')
+try:
+    from importlib.resources import files
+
+    _GRAMMAR_FILE = str(files('yamlator').joinpath('grammar/grammar.lark'))
+except ImportError:
+    # Python < 3.9 does not provide importlib.resources.files so fall
+    # back to resolving the grammar relative to this module
+    _package_dir = Path(__file__).parent.parent.absolute()
+    _GRAMMAR_FILE = os.path.join(_package_dir, 'grammar/grammar.lark')
+
+# Translation table that removes any quotes from a string. This is
+# faster than running the equivalent regex substitution per token
+_QUOTES_TRANSLATION = str.maketrans('', '', '"\'')
+
+# Primitive rule types carry no per-rule state and are never mutated
+# once created, so a shared instance is returned for each primitive
+# type instead of allocating a new RuleType per rule in the schema
+_STR_TYPE = RuleType(schema_type=SchemaTypes.STR)
+_INT_TYPE = RuleType(schema_type=SchemaTypes.INT)
+_FLOAT_TYPE = RuleType(schema_type=SchemaTypes.FLOAT)
+_ANY_TYPE = RuleType(schema_type=SchemaTypes.ANY)
+_BOOL_TYPE = RuleType(schema_type=SchemaTypes.BOOL)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_lark_parser() -> Lark:
+    """Fetches the Lark parser for the Yamlator grammar. The parser
+    is compiled once and cached so repeated calls to `parse_schema`
+    do not re-read the grammar file and rebuild the parser tables.
+
+    The parser cannot be cached on disk with the Lark `cache` argument
+    since that is only supported by the LALR parser. The grammar relies
+    on the Earley dynamic lexer to resolve the catch-all rule name
+    terminal against the schema keywords, so the cache is kept in
+    memory only
+    """
+    return Lark.open(_GRAMMAR_FILE)
 
 
 def parse_schema(schema_content: str) -> PartiallyLoadedYamlatorSchema:
@@ -59,7 +93,7 @@ def parse_schema(schema_content: str) -> PartiallyLoadedYamlatorSchema:
     if schema_content is None:
         raise ValueError('schema_content should not be None')
 
-    lark_parser = Lark.open(_GRAMMAR_FILE)
+    lark_parser = _get_lark_parser()
     transformer = SchemaTransformer()
 
     try:
@@ -68,10 +102,10 @@ def parse_schema(schema_content: str) -> PartiallyLoadedYamlatorSchema:
     except VisitError as ve:
         raise SchemaParseError(ve.orig_exc) from ve
     except UnexpectedInput as u:
-        _handle_syntax_errors(u, lark_parser, schema_content)
+        _handle_syntax_errors(u, schema_content)
 
 
-class SchemaTransformer(Transformer):
+class SchemaTransformer(Transformer_InPlace):
     """Transforms the schema contents into a set of objects that
     can be used to validate a YAML file. This class will be used by Lark
     during the parsing process.
@@ -92,22 +126,27 @@ class SchemaTransformer(Transformer):
         self.seen_constructs = {}
         self.unknown_types = []
 
+        # Caches the rule types created by container_type so repeated
+        # references to the same enum or ruleset share one RuleType
+        self._container_type_cache = {}
+
     def rule_name(self, tokens: Iterator[Token]) -> Token:
         """Processes the rule name by removing any quotes"""
         token = tokens[0]
-        name = token.value.strip()
-        name = _QUOTES_REGEX.sub('', name)
+        name = token.value.strip().translate(_QUOTES_TRANSLATION)
         return Token(value=name, type_=token.type)
 
-    def required_rule(self, tokens: Iterator[Token]) -> Rule:
+    @v_args(inline=True)
+    def required_rule(self, name: Token, rtype: RuleType,
+                      _new_lines: Token = None) -> Rule:
         """Transforms the required rule tokens in a Rule object"""
-        (name, rtype) = tokens[0:2]
-        return Rule(name.value, rtype, True)
+        return Rule(sys.intern(name.value), rtype, True)
 
-    def optional_rule(self, tokens: Iterator[Token]) -> Rule:
+    @v_args(inline=True)
+    def optional_rule(self, name: Token, rtype: RuleType,
+                      _new_lines: Token = None) -> Rule:
         """Transforms the optional rule tokens in a Rule object"""
-        (name, rtype) = tokens[0:2]
-        return Rule(name.value, rtype, False)
+        return Rule(sys.intern(name.value), rtype, False)
 
     def ruleset(self, tokens: Iterator[Token]) -> YamlatorRuleset:
         """Transforms the ruleset tokens into a YamlatorRuleset object"""
@@ -135,37 +174,37 @@ class SchemaTransformer(Transformer):
             -> PartiallyLoadedYamlatorSchema:
         """Transforms the instructions into a dict that sorts the rulesets,
         enums and entry point to validate the YAML data"""
-        root = None
         rules = {}
         enums = {}
         imports = []
 
-        enum_handler = _EnumInstructionHandler(enums)
-        handler_chain = _RulesetInstructionHandler(rules)
-        handler_chain.set_next_handler(enum_handler)
-        enum_handler.set_next_handler(_ImportInstructionHandler(imports))
-
         for instruction in instructions:
-            handler_chain.handle(instruction)
-
-        root = rules.get('main')
-        if root is not None:
-            del rules['main']
-
+            container_type = instruction.container_type
+            if container_type == ContainerTypes.RULESET:
+                rules[instruction.name] = instruction
+            elif container_type == ContainerTypes.ENUM:
+                enums[instruction.name] = instruction
+            elif container_type == ContainerTypes.IMPORT:
+                imports.extend(instruction.imports)
+
+        root = rules.pop('main', None)
         return PartiallyLoadedYamlatorSchema(root, rules, enums,
                                              imports, self.unknown_types)
 
-    def str_type(self, _: Iterator[Token]) -> RuleType:
+    @v_args(inline=True)
+    def str_type(self) -> RuleType:
         """Transforms a string type token into a RuleType object"""
-        return RuleType(schema_type=SchemaTypes.STR)
+        return _STR_TYPE
 
-    def int_type(self, _: Iterator[Token]) -> RuleType:
+    @v_args(inline=True)
+    def int_type(self) -> RuleType:
         """Transforms a int type token into a RuleType object"""
-        return RuleType(schema_type=SchemaTypes.INT)
+        return _INT_TYPE
 
-    def float_type(self, _: Iterator[Token]) -> RuleType:
+    @v_args(inline=True)
+    def float_type(self) -> RuleType:
         """Transforms a float type token into a RuleType object"""
-        return RuleType(schema_type=SchemaTypes.FLOAT)
+        return _FLOAT_TYPE
 
     def list_type(self, tokens: Iterator[Token]) -> RuleType:
         """Transforms a list type token into a RuleType object"""
@@ -175,28 +214,28 @@ class SchemaTransformer(Transformer):
         """Transforms a map type token into a RuleType object"""
         return RuleType(schema_type=SchemaTypes.MAP, sub_type=tokens[0])
 
-    def any_type(self, _: Iterator[Token]) -> RuleType:
+    @v_args(inline=True)
+    def any_type(self) -> RuleType:
         """Transforms the any type token into a RuleType object"""
-        return RuleType(schema_type=SchemaTypes.ANY)
+        return _ANY_TYPE
 
-    def bool_type(self, _: Iterator[Token]) -> RuleType:
+    @v_args(inline=True)
+    def bool_type(self) -> RuleType:
         """Transforms a bool type token into a RuleType object"""
-        return RuleType(schema_type=SchemaTypes.BOOL)
+        return _BOOL_TYPE
 
     def enum_item(self, tokens: Iterator[Token]) -> EnumItem:
         """Transforms a enum item token into a EnumItem object"""
         name, value = tokens
+        if isinstance(value, str):
+            value = sys.intern(value)
         return EnumItem(name=name, value=value)
 
     def enum(self, tokens: Iterator[Token]) -> YamlatorEnum:
         """Transforms a enum token into a YamlatorEnum object"""
-        enums = {}
-
         name = tokens[0]
-        items = tokens[1:]
+        enums = {item.value: item for item in tokens[1:]}
 
-        for item in items:
-            enums[item.value] = item
         self.seen_constructs[name] = SchemaTypes.ENUM
         return YamlatorEnum(name.value, enums)
 
@@ -213,8 +252,18 @@ class SchemaTransformer(Transformer):
         else:
             name = name.value
 
+        # Interning the lookup name means the repeated dict probes
+        # against the ruleset and enum lookups during import resolution
+        # and validation can short-circuit on pointer identity
+        name = sys.intern(name)
         schema_type = self.seen_constructs.get(name, SchemaTypes.UNKNOWN)
+        cache_key = (schema_type, name)
+        rule_type = self._container_type_cache.get(cache_key)
+        if rule_type is not None:
+            return rule_type
+
         rule_type = RuleType(schema_type=schema_type, lookup=name)
+        self._container_type_cache[cache_key] = rule_type
         if schema_type == SchemaTypes.UNKNOWN:
             self.unknown_types.append(rule_type)
         return rule_type
@@ -237,11 +286,11 @@ class SchemaTransformer(Transformer):
                 raise NestedUnionError()
         return UnionRuleType(sub_types=tokens)
 
-    def type(self, tokens: Iterator[Token]) -> Any:
-        """Extracts the type tokens and passes them onto
+    @v_args(inline=True)
+    def type(self, t: Any) -> Any:
+        """Extracts the type token and passes it onto
         the next stage in the transformer
         """
-        (t, ) = tokens
         return t
 
     def schema_entry(self, tokens: list) -> YamlatorRuleset:
@@ -274,7 +323,7 @@ class SchemaTransformer(Transformer):
         """Transforms the escaped string by removing quotes
         from the value
         """
-        return _QUOTES_REGEX.sub('', token)
+        return token.translate(_QUOTES_TRANSLATION)
 
     def import_statement(self, tokens: Iterator[Token]) -> ImportStatement:
         """Transforms an import statement into a
@@ -283,7 +332,7 @@ class SchemaTransformer(Transformer):
         items: Iterator[Token] = tokens[0]
 
         path = tokens[1]
-        path = _QUOTES_REGEX.sub('', path.value)
+        path = path.value.translate(_QUOTES_TRANSLATION)
 
         namespace = None
         try:
@@ -306,85 +355,6 @@ class GrammarKeywords(str, enum.Enum):
     STRICT = 'STRICT_KEYWORD'
 
 
-class _InstructionHandler:
-    """Base handle for dealing with Yamlator types"""
-
-    _next_handler = None
-
-    def set_next_handler(self,
-                         handler: '_InstructionHandler'
-                         ) -> '_InstructionHandler':
-        """Set the next handler in the chain
-
-        Args:
-            handler (yamlator.parser._InstructionHandler): The next
-                instruction handler
-
-        Returns:
-            The instance of the instruction handler that was
-            passed as an argument
-        """
-        self._next_handler = handler
-        return handler
-
-    def handle(self, instruction: YamlatorType) -> None:
-        if self._next_handler is not None:
-            self._next_handler.handle(instruction)
-
-
-class _EnumInstructionHandler(_InstructionHandler):
-    """Enum type instruction handler"""
-
-    def __init__(self, enums: dict):
-        super().__init__()
-        self._enums = enums
-
-    def handle(self, instruction: YamlatorType) -> None:
-        if instruction.container_type != ContainerTypes.ENUM:
-            super().handle(instruction)
-            return
-
-        self._enums[instruction.name] = instruction
-
-
-class _RulesetInstructionHandler(_InstructionHandler):
-    """Ruleset type instruction handler"""
-
-    def __init__(self, rulesets: dict):
-        super().__init__()
-        self._rulesets = rulesets
-
-    def handle(self, instruction: YamlatorType) -> None:
-        if instruction.container_type != ContainerTypes.RULESET:
-            super().handle(instruction)
-            return
-
-        self._rulesets[instruction.name] = instruction
-
-
-class _ImportInstructionHandler(_InstructionHandler):
-    """Import statement handler for putting all the
-    import statements into a single data structure
-    """
-
-    def __init__(self, imports: list):
-        """_ImportInstructionHandler init
-
-        imports (list): Reference to a list that will store all the
-            import statements that were referenced in the Yamlator schema
-        """
-        super().__init__()
-        self.imports = imports
-
-    def handle(self, instruction: YamlatorType) -> None:
-        if instruction.container_type != ContainerTypes.IMPORT:
-            super().handle(instruction)
-            return
-
-        instruction: ImportStatement = instruction
-        self.imports.extend(instruction.imports)
-
-
 class SchemaSyntaxError(SyntaxError):
     """A generic syntax error in the schema content"""
 
@@ -412,24 +382,31 @@ class MissingRulesError(SchemaSyntaxError):
     label = 'Missing rules'
 
 
-def _handle_syntax_errors(u: UnexpectedInput, parser: Lark,
-                          content: str) -> None:
-    exc_class = u.match_examples(parser.parse, {
-        MalformedRulesetNameError: [
-            'ruleset foo',
-            'ruleset 1234Foo',
-            'ruleset FOO',
-        ],
-        MalformedEnumNameError: [
-            'enum foo',
-            'enum 1234Foo',
-            'enum FOO',
-        ],
-        MissingRulesError: [
-            'ruleset Foo {}',
-            'schema {}'
-        ]
-    }, use_accepts=True)
+# Example snippets used to match a Lark syntax error to a more
+# specific error class. Built once at module scope so the mapping is
+# not reconstructed for every syntax error
+_SYNTAX_ERROR_EXAMPLES = {
+    MalformedRulesetNameError: [
+        'ruleset foo',
+        'ruleset 1234Foo',
+        'ruleset FOO',
+    ],
+    MalformedEnumNameError: [
+        'enum foo',
+        'enum 1234Foo',
+        'enum FOO',
+    ],
+    MissingRulesError: [
+        'ruleset Foo {}',
+        'schema {}'
+    ]
+}
+
+
+def _handle_syntax_errors(u: UnexpectedInput, content: str) -> None:
+    parser = _get_lark_parser()
+    exc_class = u.match_examples(parser.parse, _SYNTAX_ERROR_EXAMPLES,
+                                 use_accepts=True)
     if not exc_class:
         raise SchemaSyntaxError(u.get_context(content), u.line, u.column)
     raise exc_class(u.get_context(content), u.line, u.column)
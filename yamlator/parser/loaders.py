@@ -2,8 +2,8 @@
 load any import statements in the schema and checks for cycles
 """
 
-import re
 import os
+import posixpath
 
 from typing import Dict
 from typing import List
@@ -17,11 +17,17 @@ from yamlator.types import SchemaTypes
 from yamlator.types import PartiallyLoadedYamlatorSchema
 from yamlator.exceptions import ConstructNotFoundError
 from yamlator.exceptions import CycleDependencyError
+from yamlator.exceptions import SchemaParseError
 from yamlator.parser.core import parse_schema
 from yamlator.parser.dependency import DependencyManager
 
 
-_SLASHES_REGEX = re.compile(r'(?:\\{1}|\/{1})')
+# Caches fully resolved schemas keyed by their resolved file path so
+# a schema imported from multiple places is only parsed once per
+# process. Schemas that fail to load are never cached, which keeps
+# cycle detection intact since a schema involved in a cycle can never
+# finish loading
+_schema_cache: Dict[str, YamlatorSchema] = {}
 
 
 def parse_yamlator_schema(schema_path: str) -> YamlatorSchema:
@@ -51,14 +57,36 @@ def parse_yamlator_schema(schema_path: str) -> YamlatorSchema:
     if (schema_path is None) or (not isinstance(schema_path, str)):
         raise ValueError('Expected parameter schema_path to be a string')
 
+    cache_key = os.path.realpath(schema_path)
+    schema = _schema_cache.get(cache_key)
+    if schema is not None:
+        # A schema cached as an import may legitimately lack a schema
+        # block, so the cache hit is checked the same way as a fresh
+        # top level parse
+        if not schema.has_root:
+            raise SchemaParseError(
+                f'{schema_path} does not define a schema block')
+        return schema
+
     schema_content = load_schema(schema_path)
 
     dependencies = DependencyManager()
     schema_hash = dependencies.add(schema_content)
 
     schema = parse_schema(schema_content)
+
+    # Only the top level schema needs a schema block; child schemas
+    # loaded through imports may just define rulesets and enums.
+    # Without this check a schema-less file would silently validate
+    # any document against the empty fallback ruleset
+    if not schema.has_root:
+        raise SchemaParseError(
+            f'{schema_path} does not define a schema block')
+
     context = fetch_schema_path(schema_path)
     schema = load_schema_imports(schema, context, schema_hash, dependencies)
+
+    _schema_cache[cache_key] = schema
     return schema
 
 
@@ -82,10 +110,13 @@ def fetch_schema_path(schema_path: str) -> str:
     if not isinstance(schema_path, str):
         raise TypeError('Expected parameter schema_path to be a string')
 
-    context = _SLASHES_REGEX.split(schema_path)[:-1]
+    # Normalise Windows separators then take the directory with
+    # posixpath so the context always uses forward slashes. The leading
+    # slash is stripped to keep the context relative
+    context = posixpath.dirname(schema_path.replace('\\', '/')).lstrip('/')
     if not context:
         return '.'
-    return _SLASHES_REGEX.sub('/', os.path.join(*context))
+    return context
 
 
 def load_schema_imports(loaded_schema: PartiallyLoadedYamlatorSchema,
@@ -151,36 +182,44 @@ def load_schema_imports(loaded_schema: PartiallyLoadedYamlatorSchema,
 
         schema = _load_child_schema(full_path, parent_hash, dependencies)
 
-        imported_rulesets = schema.rulesets
-        imported_enums = schema.enums
+        # Combine the child schema's rulesets and enums into a single
+        # lookup so each requested resource is resolved with one dict
+        # probe. Rulesets take priority over enums to match the old
+        # probe order
+        exports = {name: (root_rulesets, imported_type)
+                   for name, imported_type in schema.rulesets.items()}
+        for name, imported_type in schema.enums.items():
+            exports.setdefault(name, (root_enums, imported_type))
 
         for (resource, namespace) in resource_type:
-            has_mapped_rulesets = map_imported_resource(
-                namespace,
-                resource,
-                root_rulesets,
-                imported_rulesets
-            )
-
-            if has_mapped_rulesets:
+            export = exports.get(resource)
+            if export is None:
                 continue
 
-            map_imported_resource(
-                namespace,
-                resource,
-                root_enums,
-                imported_enums
-            )
+            resource_lookup, imported_type = export
+            if namespace is not None:
+                resource = f'{namespace}.{resource}'
+            resource_lookup[resource] = imported_type
 
     unknown_types = loaded_schema.unknowns_rule_types
     resolve_unknown_types(unknown_types, root_rulesets, root_enums)
 
     root_rulesets = resolve_ruleset_inheritance(root_rulesets)
-    return YamlatorSchema(loaded_schema.root, root_rulesets, root_enums)
+
+    # The root property materializes an empty fallback ruleset, so the
+    # missing schema block is carried through as None to keep has_root
+    # meaningful on the resolved schema
+    root = loaded_schema.root if loaded_schema.has_root else None
+    return YamlatorSchema(root, root_rulesets, root_enums)
 
 
 def _load_child_schema(schema_path: str, parent_hash: str,
                        dependencies: DependencyManager) -> YamlatorSchema:
+    cache_key = os.path.realpath(schema_path)
+    cached_schema = _schema_cache.get(cache_key)
+    if cached_schema is not None:
+        return cached_schema
+
     schema_content = load_schema(schema_path)
     schema_hash = dependencies.add(schema_content)
 
@@ -195,6 +234,8 @@ def _load_child_schema(schema_path: str, parent_hash: str,
     context = fetch_schema_path(schema_path)
     schema = load_schema_imports(parsed_schema, context,
                                  parent_hash, dependencies)
+
+    _schema_cache[cache_key] = schema
     return schema
 
 
@@ -294,17 +335,13 @@ def resolve_unknown_types(unknown_types: List[RuleType],
         raise TypeError(
             'Expected parameters rulesets and enums to be dictionaries')
 
-    while len(unknown_types) > 0:
-        curr: RuleType = unknown_types.pop()
-        if enums.get(curr.lookup) is not None:
+    for curr in unknown_types:
+        if curr.lookup in enums:
             curr.schema_type = SchemaTypes.ENUM
-            continue
-
-        if rulesets.get(curr.lookup) is not None:
+        elif curr.lookup in rulesets:
             curr.schema_type = SchemaTypes.RULESET
-            continue
-
-        raise ConstructNotFoundError(curr.lookup)
+        else:
+            raise ConstructNotFoundError(curr.lookup)
     return True
 
 
@@ -16,8 +16,12 @@ EnumItem = namedtuple('EnumItem', ['name', 'value'])
 Data = Union[dict, list, int, float, str]
 
 
-class SchemaTypes(enum.Enum):
-    """Represents the supported types that can be defined in a schema"""
+class SchemaTypes(enum.IntEnum):
+    """Represents the supported types that can be defined in a schema.
+
+    An `IntEnum` is used so the equality checks against `schema_type`
+    in every validator compare at plain integer speed
+    """
 
     STR = enum.auto()
     INT = enum.auto()
@@ -35,6 +39,9 @@ class SchemaTypes(enum.Enum):
     # at runtime since the actual type is not known
     UNKNOWN = enum.auto()
 
+    def __str__(self) -> str:
+        return f'{self.__class__.__name__}.{self.name}'
+
 
 class RuleType:
     """Represents a rule's data type that is defined in the Yamlator schema
@@ -65,6 +72,9 @@ class RuleType:
             `SchemaTypes.REGEX`. For other types this will be `None`
     """
 
+    __slots__ = ('_regex', '_schema_type', '_lookup', '_sub_type',
+                 '_raw_regex', '_repr')
+
     def __init__(self, schema_type: SchemaTypes, lookup: str = None,
                  sub_type: 'RuleType' = None, regex: str = None) -> None:
         """RuleType init
@@ -90,6 +100,7 @@ class RuleType:
         self._lookup = lookup
         self._sub_type = sub_type
         self._raw_regex = regex
+        self._repr = None
 
         if regex is not None:
             self._regex = re.compile(regex)
@@ -101,6 +112,9 @@ class RuleType:
     @schema_type.setter
     def schema_type(self, value):
         self._schema_type = value
+        # Resolving an unknown type changes the repr, so drop any
+        # string that was cached before the type was resolved
+        self._repr = None
 
     @property
     def lookup(self) -> str:
@@ -138,22 +152,27 @@ class RuleType:
         return type_str
 
     def __repr__(self) -> str:
+        # The formatted string is built lazily and cached since the
+        # repr is only needed on the error reporting path
+        if self._repr is not None:
+            return self._repr
+
         if self.schema_type == SchemaTypes.RULESET:
             repr_template = '{}(type=ruleset, lookup={}, sub_type={})'
-            return repr_template.format(self.__class__.__name__,
-                                        self.lookup,
-                                        self.sub_type)
-
-        if self.schema_type == SchemaTypes.UNKNOWN:
+            self._repr = repr_template.format(self.__class__.__name__,
+                                              self.lookup,
+                                              self.sub_type)
+        elif self.schema_type == SchemaTypes.UNKNOWN:
             repr_template = '{}(type={}, lookup={})'
-            return repr_template.format(self.__class__.__name__,
-                                        self.schema_type,
-                                        self.lookup)
-
-        repr_template = '{}(type={}, sub_type={})'
-        return repr_template.format(self.__class__.__name__,
-                                    self.schema_type,
-                                    self.sub_type)
+            self._repr = repr_template.format(self.__class__.__name__,
+                                              self.schema_type,
+                                              self.lookup)
+        else:
+            repr_template = '{}(type={}, sub_type={})'
+            self._repr = repr_template.format(self.__class__.__name__,
+                                              self.schema_type,
+                                              self.sub_type)
+        return self._repr
 
 
 class UnionRuleType(RuleType):
@@ -166,6 +185,8 @@ class UnionRuleType(RuleType):
             for the `int` and `str`
     """
 
+    __slots__ = ('_sub_types', )
+
     def __init__(self, sub_types: List[RuleType]) -> None:
         """UnionRuleType init
 
@@ -188,12 +209,19 @@ class UnionRuleType(RuleType):
         return f'union({combined_sub_types_strings})'
 
 
-class ContainerTypes(enum.Enum):
-    """Enum of custom types used by Yamlator"""
+class ContainerTypes(enum.IntEnum):
+    """Enum of custom types used by Yamlator.
+
+    An `IntEnum` so comparisons when sorting transformed instructions
+    compare at plain integer speed
+    """
     RULESET = 0
     ENUM = 1
     IMPORT = 2
 
+    def __str__(self) -> str:
+        return f'{self.__class__.__name__}.{self.name}'
+
 
 class YamlatorType:
     """Base class for custom Yamlator types. Commonly used to represent
@@ -208,6 +236,8 @@ class YamlatorType:
             representation of the current type
     """
 
+    __slots__ = ('_name', '_container_type')
+
     def __init__(self, name: str, container_type: ContainerTypes):
         """YamlatorType init
 
@@ -255,6 +285,8 @@ class YamlatorRuleset(YamlatorType):
             is not specified this defaults to `None`
     """
 
+    __slots__ = ('_rules', '_is_strict', '_parent')
+
     def __init__(self, name: str, rules: List[Rule],
                  is_strict: bool = False, parent: RuleType = None):
         """YamlatorRuleset init
@@ -317,6 +349,8 @@ class YamlatorEnum(YamlatorType):
         }
     """
 
+    __slots__ = ('_items', )
+
     def __init__(self, name: str, items: dict):
         """YamlatorEnum init
 
@@ -330,7 +364,9 @@ class YamlatorEnum(YamlatorType):
 
     @property
     def items(self) -> dict:
-        return self._items.copy()
+        # Returned without copying so enum validation stays a single
+        # dict probe rather than an O(n) copy per access
+        return self._items
 
 
 class ImportedType:
@@ -469,6 +505,13 @@ class YamlatorSchema:
             return YamlatorRuleset('main', [])
         return self._root
 
+    @property
+    def has_root(self) -> bool:
+        """Indicates if the schema defined a schema block, since `root`
+        falls back to an empty ruleset when one was not defined
+        """
+        return self._root is not None
+
     @property
     def rulesets(self):
         if self._rulesets is None:
@@ -1,7 +1,6 @@
 """Utility functions to handle loading YAML files and Yamlator schemas"""
 
 
-import yaml
 import re
 
 from typing import Any
@@ -13,6 +12,11 @@ _BACKSLASH_REGEX = re.compile(r'[\\]{1,2}')
 
 KEYLESS_RULE_DIRECTIVE = '!!yamlator'
 
+# Resolved on the first load_yaml_file call so importing this module,
+# which nearly every other module pulls in for is_keyless_rule, does
+# not pay the cost of loading PyYAML
+_YAML_LOADER = None
+
 
 def is_keyless_rule(rule: Rule) -> bool:
     """Checks if a rule has a name that matches a keyless
@@ -66,8 +70,20 @@ def load_yaml_file(filename: str) -> Any:
     if len(filename) == 0:
         raise ValueError('filename cannot be an empty string')
 
+    # Imported here so modules that only need is_keyless_rule do not
+    # pull in PyYAML when they import this module
+    import yaml
+
+    global _YAML_LOADER
+    if _YAML_LOADER is None:
+        # Use the libyaml C loader when PyYAML was built with it since
+        # it is considerably faster than the pure Python loader. Falls
+        # back to the pure Python loader when the C extension is not
+        # available
+        _YAML_LOADER = getattr(yaml, 'CLoader', yaml.Loader)
+
     with open(filename, 'r', encoding='utf-8') as f:
-        return yaml.load(f, Loader=yaml.Loader)
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 
 def load_schema(filename: str) -> str:
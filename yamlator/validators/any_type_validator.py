@@ -5,11 +5,17 @@ from yamlator.types import RuleType
 from yamlator.types import SchemaTypes
 from yamlator.validators.base_validator import Validator
 
+# Bound at module level so the hot validate path loads the enum
+# member as a global instead of an attribute lookup per call
+_ANY = SchemaTypes.ANY
+
 
 class AnyTypeValidator(Validator):
     """Validator to handle the `any` type. This type ignores all type checks
     against the data"""
 
+    __slots__ = ()
+
     def validate(self, key: str, data: Data, parent: str, rtype: RuleType,
                  is_required: bool = False) -> None:
         """Validate any rules that have the data marked as the `any` type
@@ -22,7 +28,7 @@ class AnyTypeValidator(Validator):
                 rule that will be applied to the data
             is_required (bool, optional): Indicates if the rule is required
         """
-        is_any_type = (rtype.schema_type == SchemaTypes.ANY)
+        is_any_type = (rtype.schema_type == _ANY)
         if is_any_type:
             return
 
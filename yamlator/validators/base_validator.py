@@ -10,7 +10,9 @@ from yamlator.violations import TypeViolation
 class Validator:
     """Base Validator handler"""
 
-    _next_validator = None
+    # Slots shrink each validator instance and make the hot attribute
+    # reads a C-level slot index instead of a dict probe
+    __slots__ = ('_violations', '_next_validator')
 
     def __init__(self, violations: deque) -> None:
         """Validator init
@@ -20,6 +22,7 @@ class Validator:
                 have been detected whilst processing the data
         """
         self._violations = violations
+        self._next_validator = None
 
     def set_next_validator(self, validator: 'Validator') -> 'Validator':
         """Set the next validator in the chain
@@ -15,6 +15,8 @@ _SchemaTypeDecoder = namedtuple('SchemaTypeDecoder', ['type', 'friendly_name'])
 class BuiltInTypeValidator(Validator):
     """Validator to handle the builtin types. e.g `int`, `list` & `str`"""
 
+    __slots__ = ('_built_in_lookups', )
+
     def __init__(self, violations: deque) -> None:
         """BuiltInTypeValidator init
 
@@ -53,7 +55,10 @@ class BuiltInTypeValidator(Validator):
             super().validate(key, data, parent, rtype, is_required)
             return
 
-        if not isinstance(data, buildin_type.type):
+        # Check type identity first since YAML data is almost always a
+        # concrete builtin type; isinstance only runs for subclasses
+        if type(data) is not buildin_type.type and \
+                not isinstance(data, buildin_type.type):
             message = f'{key} should be of type {buildin_type.friendly_name}'
             self._add_type_violation(key, parent, message)
             return
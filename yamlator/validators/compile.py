@@ -0,0 +1,59 @@
+"""Compiles a schema into a reusable validation callable"""
+
+from collections import deque
+from typing import Callable
+
+from yamlator.types import Data
+from yamlator.types import YamlatorSchema
+from yamlator.validators.core import _create_validators_chain
+
+_DEFAULT_KEY = '-'
+
+
+def compile_schema(schema: YamlatorSchema) -> Callable[[Data], deque]:
+    """Compile a schema into a callable that validates YAML data
+
+    The validator chain is constructed once when the schema is compiled
+    and then reused for every call, which avoids rebuilding the chain
+    when the same schema is used to validate many documents
+
+    Args:
+        schema (yamlator.types.YamlatorSchema): Contains the enums and
+            rulesets that will be used to validate the YAML data
+
+    Returns:
+        A callable that accepts the YAML data to validate and returns
+        a `deque` with the violations that were detected in the data
+
+    Raises:
+        ValueError: When the parameter `schema` is `None`
+    """
+    if schema is None:
+        raise ValueError('schema should not be None')
+
+    violations = deque()
+    validators = _create_validators_chain(schema, violations)
+
+    def validate(yaml_data: Data) -> deque:
+        """Validate YAML data against the compiled schema
+
+        Args:
+            yaml_data (yamlator.types.Data): The YAML data to validate.
+                Assumes the YAML contains a root key
+
+        Returns:
+            A deque that contains the violations that were detected
+            in the data
+
+        Raises:
+            ValueError: When the parameter `yaml_data` is `None`
+        """
+        if yaml_data is None:
+            raise ValueError('yaml_data should not be None')
+
+        violations.clear()
+        validators.validate(_DEFAULT_KEY, yaml_data,
+                            _DEFAULT_KEY, None)
+        return deque(violations)
+
+    return validate
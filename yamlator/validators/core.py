@@ -3,6 +3,9 @@ validator handler chian.
 """
 
 from collections import deque
+from yamlator.types import Data
+from yamlator.types import RuleType
+from yamlator.types import SchemaTypes
 from yamlator.types import YamlatorSchema
 
 from yamlator.validators import AnyTypeValidator
@@ -50,6 +53,47 @@ def validate_yaml(yaml_data: dict, schema: YamlatorSchema) -> deque:
     return violations
 
 
+class _TypeDispatchValidator(Validator):
+    """Routes a rule to the validator for its schema type with a single
+    dict lookup instead of forwarding the data through every validator
+    in the chain
+    """
+
+    __slots__ = ('_validators', )
+
+    def __init__(self, violations: deque, validators: dict) -> None:
+        """_TypeDispatchValidator init
+
+        Args:
+            violations (collections.deque): Contains violations that
+                have been detected whilst processing the data
+
+            validators (dict): Maps a `yamlator.types.SchemaTypes` to
+                the validator instance that handles that type
+        """
+        super().__init__(violations)
+        self._validators = validators
+
+    def validate(self, key: str, data: Data, parent: str, rtype: RuleType,
+                 is_required: bool = False) -> None:
+        """Validate the data by routing it to the validator that
+        handles the rule's schema type. Types without a validator are
+        ignored, which matches the data falling off the end of the
+        previous validator chain
+
+        Args:
+            key (str): The data field name
+            data (yamlator.types.Data): The data to validate
+            parent (str): The parent key of the data
+            rtype (yamlator.types.RuleType): The type assigned to the
+                rule that will be applied to the data
+            is_required (bool, optional): Indicates if the rule is required
+        """
+        validator = self._validators.get(rtype.schema_type)
+        if validator is not None:
+            validator.validate(key, data, parent, rtype, is_required)
+
+
 def _create_validators_chain(instructions: YamlatorSchema,
                              violations: deque) -> Validator:
     ruleset_lookups = instructions.rulesets
@@ -68,14 +112,32 @@ def _create_validators_chain(instructions: YamlatorSchema,
     regex_validator = RegexValidator(violations)
     union_validator = UnionValidator(violations)
 
+    type_dispatcher = _TypeDispatchValidator(violations, {
+        SchemaTypes.MAP: map_validator,
+        SchemaTypes.RULESET: ruleset_validator,
+        SchemaTypes.LIST: list_validator,
+        SchemaTypes.ENUM: enum_validator,
+        SchemaTypes.ANY: any_type_validator,
+        SchemaTypes.REGEX: regex_validator,
+        SchemaTypes.UNION: union_validator,
+        SchemaTypes.INT: type_validator,
+        SchemaTypes.STR: type_validator,
+        SchemaTypes.FLOAT: type_validator,
+        SchemaTypes.BOOL: type_validator,
+    })
+
     root.set_next_validator(optional_validator)
     optional_validator.set_next_validator(required_validator)
-    required_validator.set_next_validator(map_validator)
-    map_validator.set_next_validator(ruleset_validator)
+    required_validator.set_next_validator(type_dispatcher)
+
+    # Map values re-enter the dispatcher so nested sub types are routed
+    # with the same single lookup as top level rules
+    map_validator.set_next_validator(type_dispatcher)
 
     ruleset_validator.set_next_ruleset_validator(optional_validator)
-    ruleset_validator.set_next_validator(list_validator)
 
+    # List items keep the original enum -> any -> regex -> builtin ->
+    # union subchain so the sub type handling inside lists is unchanged
     list_validator.set_ruleset_validator(ruleset_validator)
     list_validator.set_next_validator(enum_validator)
 
@@ -16,6 +16,8 @@ from .base_validator import Validator
 class EntryPointValidator(Validator):
     """Validator to handle the `schema` / entry point of the Yamlator rules"""
 
+    __slots__ = ('_entry_point', '_flat_validator')
+
     def __init__(self, violations: deque, entry_point: YamlatorRuleset):
         """EntryPointValidator init
 
@@ -7,10 +7,15 @@ from yamlator.types import RuleType
 from yamlator.types import SchemaTypes
 from yamlator.validators.base_validator import Validator
 
+# Bound at module level to avoid the enum attribute lookup per call
+_ENUM = SchemaTypes.ENUM
+
 
 class EnumTypeValidator(Validator):
     """Validator to handle enum types"""
 
+    __slots__ = ('_enums', )
+
     def __init__(self, violations: deque, enums: dict):
         """EnumTypeValidator init
 
@@ -35,7 +40,7 @@ class EnumTypeValidator(Validator):
                 rule that will be applied to the data
             is_required (bool, optional): Indicates if the rule is required
         """
-        is_enum_type = (rtype.schema_type == SchemaTypes.ENUM)
+        is_enum_type = (rtype.schema_type == _ENUM)
         if not is_enum_type:
             super().validate(key, data, parent, rtype, is_required)
             return
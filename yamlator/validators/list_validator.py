@@ -6,11 +6,25 @@ from yamlator.types import RuleType
 from yamlator.types import SchemaTypes
 from yamlator.validators.base_validator import Validator
 
+# Bound at module level to avoid the enum attribute lookup per call
+_LIST = SchemaTypes.LIST
+_RULESET = SchemaTypes.RULESET
+
 
 class ListValidator(Validator):
     """Validator for handling list types"""
 
-    _ruleset_validator: Validator = None
+    __slots__ = ('_ruleset_validator', )
+
+    def __init__(self, violations) -> None:
+        """ListValidator init
+
+        Args:
+            violations (collections.deque): Contains violations that
+                have been detected whilst processing the data
+        """
+        super().__init__(violations)
+        self._ruleset_validator: Validator = None
 
     def set_ruleset_validator(self, validator: Validator) -> None:
         """Set a validator for handling nested rulesets in the list
@@ -23,8 +37,8 @@ class ListValidator(Validator):
 
     def validate(self, key: str, data: Data, parent: str, rtype: RuleType,
                  is_required: bool = False) -> None:
-        """Validate the list data. This validator will recursive if
-        nested lists are detected in the rule
+        """Validate the list data. Nested lists in the rule are walked
+        iteratively with an explicit stack
 
         Args:
             key (str): The data field name
@@ -34,42 +48,56 @@ class ListValidator(Validator):
                 rule that will be applied to the data
             is_required (bool, optional): Indicates if the rule is required
         """
-        is_list_data = isinstance(data, list)
-        is_list_rule = (rtype.schema_type == SchemaTypes.LIST)
-
+        is_list_rule = (rtype.schema_type == _LIST)
         if not is_list_rule:
             super().validate(key, data, parent, rtype, is_required)
             return
 
-        if not is_list_data:
-            message = f'{key} should be of type list'
-            self._add_type_violation(key, parent, message)
-            return
-
-        for idx, item in enumerate(data):
-            current_key = f'{key}[{idx}]'
-
-            # loop over any nested lists
-            self.validate(
-                key=current_key,
-                parent=key,
-                data=item,
-                rtype=rtype.sub_type
-            )
-
-            # a list could contain ruleset items
-            # so need to run each item through that validator
-            self._run_ruleset_validator(
-                key=current_key,
-                parent=key,
-                data=item,
-                rtype=rtype.sub_type
-            )
+        # Nested lists are traversed with an explicit stack instead of
+        # recursion so deeply nested documents cannot exhaust the
+        # interpreter recursion limit. Frames are pushed in reverse to
+        # keep items validated in document order
+        stack = [(key, data, parent, rtype)]
+        while stack:
+            key, data, parent, rtype = stack.pop()
+
+            # The type identity check handles the common case of a
+            # plain list without the isinstance machinery; the
+            # isinstance fallback keeps list subclasses working
+            if type(data) is not list and not isinstance(data, list):
+                message = f'{key} should be of type list'
+                self._add_type_violation(key, parent, message)
+                continue
+
+            sub_type = rtype.sub_type
+            if sub_type.schema_type == _LIST:
+                for idx in range(len(data) - 1, -1, -1):
+                    stack.append((f'{key}[{idx}]', data[idx], key, sub_type))
+                continue
+
+            for idx, item in enumerate(data):
+                current_key = f'{key}[{idx}]'
+
+                super().validate(
+                    key=current_key,
+                    parent=key,
+                    data=item,
+                    rtype=sub_type
+                )
+
+                # a list could contain ruleset items
+                # so need to run each item through that validator
+                self._run_ruleset_validator(
+                    key=current_key,
+                    parent=key,
+                    data=item,
+                    rtype=sub_type
+                )
 
     def _run_ruleset_validator(self, key: str, parent: str, data: Data,
                                rtype: RuleType) -> None:
         has_ruleset_validator = (self._ruleset_validator is not None)
-        is_ruleset_rule = (rtype.schema_type == SchemaTypes.RULESET)
+        is_ruleset_rule = (rtype.schema_type == _RULESET)
 
         if has_ruleset_validator and is_ruleset_rule:
             self._ruleset_validator.validate(
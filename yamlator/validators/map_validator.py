@@ -4,12 +4,26 @@
 from yamlator.types import Data
 from yamlator.types import RuleType
 from yamlator.types import SchemaTypes
+from yamlator.violations import TypeViolation
 from .base_validator import Validator
 
+# Primitive value types that can be checked inline instead of
+# re-entering the validator chain for every map entry
+_PRIMITIVE_LOOKUPS = {
+    SchemaTypes.INT: (int, 'int'),
+    SchemaTypes.STR: (str, 'str'),
+    SchemaTypes.FLOAT: (float, 'float'),
+}
+
+# Bound at module level to avoid the enum attribute lookup per call
+_MAP = SchemaTypes.MAP
+
 
 class MapValidator(Validator):
     """Validator to handle map types"""
 
+    __slots__ = ()
+
     def validate(self, key: str, data: Data, parent: str, rtype: RuleType,
                  is_required: bool = False) -> None:
         """Validate the data contained within in a map
@@ -22,8 +36,12 @@ class MapValidator(Validator):
                 rule that will be applied to the data
             is_required (bool, optional): Indicates if the rule is required
         """
-        is_map_rule = (rtype.schema_type == SchemaTypes.MAP)
-        is_map_data = isinstance(data, dict)
+        is_map_rule = (rtype.schema_type == _MAP)
+
+        # The type identity check handles the common case of a plain
+        # dict without the isinstance machinery; the isinstance fallback
+        # keeps dict subclasses working
+        is_map_data = (type(data) is dict) or isinstance(data, dict)
 
         if not is_map_rule:
             super().validate(key, data, parent, rtype, is_required)
@@ -34,9 +52,32 @@ class MapValidator(Validator):
             self._add_type_violation(key, parent, message)
             return
 
+        sub_type = rtype.sub_type
+        primitive = _PRIMITIVE_LOOKUPS.get(
+            sub_type.schema_type) if sub_type is not None else None
+        if primitive is not None:
+            self._validate_primitive_entries(key, data, primitive)
+            return
+
         for child_key, value in data.items():
             self.validate(
                 key=child_key,
                 data=value,
                 parent=key,
-                rtype=rtype.sub_type)
+                rtype=sub_type)
+
+    def _validate_primitive_entries(self, key: str, data: dict,
+                                    primitive: tuple) -> None:
+        # Wide maps of primitives are the common case, so the type
+        # check is inlined here to avoid a full pass through the
+        # validator chain per entry. The subclass fallback mirrors
+        # the BuiltInTypeValidator check
+        expected_type, friendly_name = primitive
+        violations = self._violations
+
+        for child_key, value in data.items():
+            if type(value) is expected_type or \
+                    isinstance(value, expected_type):
+                continue
+            message = f'{child_key} should be of type {friendly_name}'
+            violations.append(TypeViolation(child_key, key, message))
@@ -9,6 +9,8 @@ from .base_validator import Validator
 class OptionalValidator(Validator):
     """Validator for handling optional rules"""
 
+    __slots__ = ()
+
     def validate(self, key: str, data: Data, parent: str, rtype: RuleType,
                  is_required: bool = False) -> None:
         """Validate an optional rule.
@@ -22,8 +24,9 @@ class OptionalValidator(Validator):
             is_required (bool, optional): Indicates if the rule is required
         """
 
-        missing_data = data is None
-        if (not is_required) and missing_data:
+        # Data being present is the common case, so it is tested first
+        # and the required flag is only consulted for missing data
+        if data is None and not is_required:
             return
 
         super().validate(key, data, parent, rtype, is_required)
@@ -7,10 +7,15 @@ from yamlator.types import SchemaTypes
 from yamlator.violations import RegexTypeViolation
 from .base_validator import Validator
 
+# Bound at module level to avoid the enum attribute lookup per call
+_REGEX = SchemaTypes.REGEX
+
 
 class RegexValidator(Validator):
     """Validator to handle the regex type in a schema"""
 
+    __slots__ = ()
+
     def validate(self, key: str, data: Data, parent: str, rtype: RuleType,
                  is_required: bool = False) -> None:
         """Validate a regex rule type against a string. If the data
@@ -27,7 +32,7 @@ class RegexValidator(Validator):
                 rule that will be applied to the data
             is_required (bool, optional): Indicates if the rule is required
         """
-        is_regex_type = (rtype.schema_type == SchemaTypes.REGEX)
+        is_regex_type = (rtype.schema_type == _REGEX)
         if not is_regex_type:
             super().validate(key, data, parent, rtype, is_required)
             return
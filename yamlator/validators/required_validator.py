@@ -10,6 +10,8 @@ from .base_validator import Validator
 class RequiredValidator(Validator):
     """Validator for handling required rules"""
 
+    __slots__ = ()
+
     def validate(self, key: str, data: Data, parent: str, rtype: RuleType,
                  is_required: bool = False) -> None:
         """Validate a key is a required rule
@@ -23,8 +25,9 @@ class RequiredValidator(Validator):
             is_required (bool, optional): Indicates if the rule is required
         """
 
-        missing_data = data is None
-        if is_required and missing_data:
+        # Data being present is the common case, so it is tested first
+        # and the required flag is only consulted for missing data
+        if data is None and is_required:
             violation = RequiredViolation(key, parent)
             self._violations.append(violation)
             return
@@ -11,11 +11,14 @@ from yamlator.violations import RulesetTypeViolation
 from yamlator.violations import StrictRulesetViolation
 from .base_validator import Validator
 
+# Bound at module level to avoid the enum attribute lookup per call
+_RULESET = SchemaTypes.RULESET
+
 
 class RulesetValidator(Validator):
     """Validator for handling rulesets types"""
 
-    _ruleset_validator: Validator = None
+    __slots__ = ('_instructions', '_resolved_rulesets', '_ruleset_validator')
 
     def __init__(self, violations: deque, instructions: dict):
         """RulesetValidator init
@@ -26,6 +29,8 @@ class RulesetValidator(Validator):
             instructions (dict): A dict containing references to other rulesets
         """
         self._instructions = instructions
+        self._resolved_rulesets = {}
+        self._ruleset_validator: Validator = None
         super().__init__(violations)
 
     def set_next_ruleset_validator(self, validator: Validator) -> None:
@@ -63,7 +68,7 @@ class RulesetValidator(Validator):
             is_required (bool, optional): Indicates if the rule is required
         """
 
-        is_ruleset_rule = (rtype.schema_type == SchemaTypes.RULESET)
+        is_ruleset_rule = (rtype.schema_type == _RULESET)
         if not is_ruleset_rule:
             super().validate(key, data, parent, rtype, is_required)
             return
@@ -77,21 +82,33 @@ class RulesetValidator(Validator):
         ruleset = self._retrieve_ruleset(rtype.lookup)
         self._handle_strict_violations(key, parent, ruleset, data)
 
+        # Hoisted to locals so the rule loop does not repeat the
+        # attribute and method lookups for every rule
+        next_validator = self._ruleset_validator
+        if next_validator is None:
+            return
+
         for ruleset_rule in ruleset.rules:
             sub_data = data.get(ruleset_rule.name, None)
 
-            if self._ruleset_validator is not None:
-                self._ruleset_validator.validate(
-                    key=ruleset_rule.name,
-                    data=sub_data,
-                    parent=key,
-                    rtype=ruleset_rule.rtype,
-                    is_required=ruleset_rule.is_required
-                )
+            next_validator.validate(
+                key=ruleset_rule.name,
+                data=sub_data,
+                parent=key,
+                rtype=ruleset_rule.rtype,
+                is_required=ruleset_rule.is_required
+            )
 
     def _retrieve_ruleset(self, ruleset_name: str) -> YamlatorRuleset:
-        default_missing_ruleset = YamlatorRuleset(ruleset_name, [])
-        ruleset = self._instructions.get(ruleset_name, default_missing_ruleset)
+        # Resolutions are memoized so a ruleset referenced many times
+        # is looked up once and a missing ruleset does not allocate a
+        # new placeholder on every validation
+        ruleset = self._resolved_rulesets.get(ruleset_name)
+        if ruleset is None:
+            ruleset = self._instructions.get(ruleset_name)
+            if ruleset is None:
+                ruleset = YamlatorRuleset(ruleset_name, [])
+            self._resolved_rulesets[ruleset_name] = ruleset
         return ruleset
 
     def _handle_strict_violations(self, key: str, parent: str,
@@ -19,6 +19,8 @@ _MIN_INDEX = 0
 class UnionValidator(Validator):
     """Validator for handling the union type"""
 
+    __slots__ = ('_sub_type_validators', )
+
     _type_lookups = {
         SchemaTypes.INT: _SchemaTypeDecoder(int, 'int'),
         SchemaTypes.STR: _SchemaTypeDecoder(str, 'str'),
@@ -28,7 +30,17 @@ class UnionValidator(Validator):
         SchemaTypes.BOOL: _SchemaTypeDecoder(bool, 'bool'),
     }
 
-    _sub_type_validators = {}
+    def __init__(self, violations) -> None:
+        """UnionValidator init
+
+        Args:
+            violations (collections.deque): Contains violations that
+                have been detected whilst processing the data
+        """
+        super().__init__(violations)
+        # Instance state rather than a class attribute so two validator
+        # chains alive at once cannot clobber each other's sub validators
+        self._sub_type_validators = {}
 
     def set_ruleset_validator(self, validator: Validator) -> None:
         self._sub_type_validators[SchemaTypes.RULESET] = validator
@@ -84,7 +96,11 @@ class UnionValidator(Validator):
                 union_violations.append(union_violation)
                 continue
 
-            builtin = self._type_lookups[sub_rule_type.schema_type]
+            builtin = self._type_lookups.get(sub_rule_type.schema_type)
+            if builtin is None:
+                # A composite sub type without a registered validator
+                # halts the union validation
+                return
             if not isinstance(data, builtin.type):
                 union_violation = _UnionViolation(1, builtin.friendly_name)
                 union_violations.append(union_violation)